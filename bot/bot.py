@@ -6,6 +6,7 @@ from disnake.ext import commands
 from loguru import logger
 
 from bot.utils.extensions import EXTENSIONS, walk_extensions
+from bot.utils.images import close_session
 
 from . import constants
 
@@ -59,6 +60,11 @@ class Bot(commands.Bot):
 
         super().run(constants.TOKEN)
 
+    async def close(self) -> None:
+        """Close the shared HTTP session before disconnecting from discord."""
+        await close_session()
+        await super().close()
+
     async def on_ready(self) -> None:
         """Ran when the bot has connected to discord and is ready."""
         logger.info("Bot online")
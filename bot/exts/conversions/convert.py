@@ -33,7 +33,7 @@ class Convert(commands.Cog):
         except commands.BadArgument as e:
             try:  # It might be a .SVG
                 raw_bytes = (await download_bytes(image_url)).getvalue()
-                image = rasterize_svg(raw_bytes)
+                image = await rasterize_svg(raw_bytes)
             except BadArgument:
                 raise e  # Raise the original error
 
@@ -28,7 +28,7 @@ class Rasterize(commands.Cog):
     ) -> None:
         """Rasterizes a given SVG-file."""
         raw_bytes = (await download_bytes(image_url)).getvalue()
-        image = rasterize_svg(raw_bytes, scale)
+        image = await rasterize_svg(raw_bytes, scale)
         file = image_to_file(image, filename_from_url(image_url), output_format)
 
         await inter.response.send_message(file=file)
@@ -1,5 +1,7 @@
+import functools
 import logging
 import re
+import unicodedata
 from typing import Literal, Optional
 
 import disnake
@@ -15,6 +17,11 @@ BASE_URLS = {
     "svg": "https://raw.githubusercontent.com/twitter/twemoji/master/assets/svg/",
 }
 CODE = re.compile(r"[a-f1-9][a-f0-9]{3,5}$")
+# Bound method, so trim_code skips an attribute lookup on every call.
+_code_search = CODE.search
+_ASCII_LOWER = bytes.maketrans(
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", b"abcdefghijklmnopqrstuvwxyz"
+)
 
 
 class Twemoji(commands.Cog):
@@ -24,6 +31,7 @@ class Twemoji(commands.Cog):
         self.bot = bot
 
     @staticmethod
+    @functools.lru_cache(maxsize=8192)
     def get_url(codepoint: str, format: Literal["png", "svg"]) -> str:
         """Returns a source file URL for the specified Twemoji, in the corresponding format."""
         return f"{BASE_URLS[format]}{codepoint}.{format}"
@@ -45,10 +53,20 @@ class Twemoji(commands.Cog):
     @staticmethod
     def build_embed(codepoint: str) -> disnake.Embed:
         """Returns the main embed for the `twemoji` commmand."""
-        emoji = "".join(Twemoji.emoji(e) for e in codepoint.split("-"))
+        # `codepoint` comes from codepoint_from_input, so every component
+        # is already trimmed hex; no need to re-run trim_code's regex.
+        emoji = "".join([chr(int(code, 16)) for code in codepoint.split("-")])
+
+        try:
+            # The canonical name from the unicode database, without going
+            # through the emoji package's alias dict.
+            title = unicodedata.name(emoji).capitalize()
+        except (TypeError, ValueError):
+            # Multi-codepoint sequences (ZWJ, flags) have no single name.
+            title = Twemoji.alias_to_name(UNICODE_EMOJI_ENGLISH[emoji])
 
         embed = create_embed(
-            title=Twemoji.alias_to_name(UNICODE_EMOJI_ENGLISH[emoji]),
+            title=title,
             description=f"{codepoint.replace('-', ' ')}\n[Download svg]({Twemoji.get_url(codepoint, 'svg')})",
             thumbnail_url=Twemoji.get_url(codepoint, "png"),
         )
@@ -95,10 +113,11 @@ class Twemoji(commands.Cog):
         """
         if not codepoint:
             return None
-        if code := CODE.search(codepoint):
+        if code := _code_search(codepoint):
             return code.group()
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def codepoint_from_input(raw_emoji: str) -> str:
         """
         Returns the codepoint corresponding to the passed tuple, separated by "-".
@@ -113,11 +132,26 @@ class Twemoji(commands.Cog):
         >>> codepoint_from_input(("👨‍👧‍👦",))
         "1f468-200d-1f467-200d-1f466"
         """
-        emoji_list: list[str] = [emoji.lower() for emoji in raw_emoji.split()]
+        try:
+            # Codepoint input is pure ASCII, where a bytes.translate
+            # table lowercases in one pass without the full unicode
+            # case-mapping machinery.
+            lowered = raw_emoji.encode("ascii").translate(_ASCII_LOWER)
+            emoji_list: list[str] = [token.decode("ascii") for token in lowered.split()]
+        except UnicodeEncodeError:
+            # An actual emoji character is present.
+            emoji_list = raw_emoji.lower().split()
         if is_emoji(emoji_list[0]):
             emojis = (Twemoji.codepoint(emoji) for emoji in emoji_list[0])
             return "-".join(emojis)
 
+        if all(CODE.fullmatch(code) for code in emoji_list):
+            # Already trimmed codepoints: validate once and skip the
+            # chr/ord round trip, since re-hexing would return the input.
+            if is_emoji("".join(chr(int(code, 16)) for code in emoji_list)):
+                return "-".join(emoji_list)
+            raise ValueError("No codepoint could be obtained from the given input")
+
         emoji = "".join(Twemoji.emoji(Twemoji.trim_code(code)) for code in emoji_list)  # type: ignore
         if is_emoji(emoji):
             return "-".join(Twemoji.codepoint(e) for e in emoji)
@@ -1,6 +1,6 @@
-import functools
+import asyncio
 import typing as t
-from enum import Enum
+from itertools import chain
 
 from bot import exts
 from bot.bot import Bot
@@ -18,14 +18,23 @@ UNLOAD_BLACKLIST = {
 }
 BASE_PATH_LEN = len(exts.__name__.split("."))
 
-
-class Action(Enum):
-    """Represents an action to perform on an extension."""
-
-    # Need to be partial otherwise they are considered to be function definitions.
-    LOAD = functools.partial(Bot.load_extension)
-    UNLOAD = functools.partial(Bot.unload_extension)
-    RELOAD = functools.partial(Bot.reload_extension)
+# EXTENSIONS is fixed at boot, so the category and leaf name of each
+# extension can be computed once instead of on every `list` command.
+_EXT_INFO: dict[str, tuple[str, str]] = {}
+for _ext in EXTENSIONS:
+    _parts = _ext.split(".")
+    if len(_parts) > BASE_PATH_LEN + 1:
+        _category = " - ".join(_parts[BASE_PATH_LEN:-1])
+    else:
+        _category = "uncategorised"
+    _EXT_INFO[_ext] = (_category, _parts[-1])
+
+# Maps an action verb to the bot method that performs it.
+_ACTION_METHODS = {
+    "load": "load_extension",
+    "unload": "unload_extension",
+    "reload": "reload_extension",
+}
 
 
 class Extensions(commands.Cog):
@@ -33,6 +42,9 @@ class Extensions(commands.Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        # Serializes entry into disnake's non-reentrant load/unload path
+        # across overlapping admin commands.
+        self._manage_lock = asyncio.Lock()
 
     @group(
         name="extensions",
@@ -54,10 +66,11 @@ class Extensions(commands.Cog):
             await ctx.send_help(ctx.command)
             return
 
-        if "*" in extensions or "**" in extensions:
-            extensions = set(EXTENSIONS) - set(self.bot.extensions.keys())
+        ext_set = set(extensions)
+        if "*" in ext_set or "**" in ext_set:
+            extensions = EXTENSIONS - self.bot.extensions.keys()
 
-        msg, did_error = self.batch_manage(Action.LOAD, *extensions)  # type: ignore
+        msg, did_error = await self.batch_manage("load", *extensions)  # type: ignore
         embed = create_embed("error" if did_error else "confirmation", msg)
         await ctx.send(embed=embed)
 
@@ -72,7 +85,8 @@ class Extensions(commands.Cog):
             await ctx.send_help(ctx.command)
             return
 
-        blacklisted = "\n".join(UNLOAD_BLACKLIST & set(extensions))
+        ext_set = set(extensions)
+        blacklisted = "\n".join(UNLOAD_BLACKLIST & ext_set)
 
         if blacklisted:
             msg = (
@@ -80,10 +94,10 @@ class Extensions(commands.Cog):
             )
             did_error = True
         else:
-            if "*" in extensions or "**" in extensions:
-                extensions = set(self.bot.extensions.keys()) - UNLOAD_BLACKLIST
+            if "*" in ext_set or "**" in ext_set:
+                extensions = self.bot.extensions.keys() - UNLOAD_BLACKLIST
 
-            msg, did_error = self.batch_manage(Action.UNLOAD, *extensions)
+            msg, did_error = await self.batch_manage("unload", *extensions)
 
         embed = create_embed("error" if did_error else "confirmation", msg)
         await ctx.send(embed=embed)
@@ -102,13 +116,17 @@ class Extensions(commands.Cog):
             await ctx.send_help(ctx.command)
             return
 
-        if "**" in extensions:
+        ext_set = set(extensions)
+        if "**" in ext_set:
             extensions = EXTENSIONS
-        elif "*" in extensions:
-            extensions = set(self.bot.extensions.keys()) | set(extensions)
-            extensions.remove("*")
-
-        msg, did_error = self.batch_manage(Action.RELOAD, *extensions)
+        elif "*" in ext_set:
+            # dict.fromkeys keeps the order stable, unlike a set union,
+            # so failures are reported in a predictable order.
+            merged = dict.fromkeys(chain(self.bot.extensions, extensions))
+            merged.pop("*", None)
+            extensions = tuple(merged)
+
+        msg, did_error = await self.batch_manage("reload", *extensions)
         embed = create_embed("error" if did_error else "confirmation", msg)
         await ctx.send(embed=embed)
 
@@ -140,39 +158,44 @@ class Extensions(commands.Cog):
         """Return a mapping of extension names and statuses to their categories."""
         categories = {}
 
-        for ext in EXTENSIONS:
+        for ext, (category, leaf) in _EXT_INFO.items():
             if ext in self.bot.extensions:
                 status = Emojis.status_online
             else:
                 status = Emojis.status_offline
 
-            path = ext.split(".")
-            if len(path) > BASE_PATH_LEN + 1:
-                category = " - ".join(path[BASE_PATH_LEN:-1])
-            else:
-                category = "uncategorised"
-
-            categories.setdefault(category, []).append(f"{status}  {path[-1]}")
+            categories.setdefault(category, []).append(f"{status}  {leaf}")
 
         return categories
 
-    def batch_manage(self, action: Action, *extensions: str) -> tuple[str, bool]:
+    async def batch_manage(self, verb: str, *extensions: str) -> tuple[str, bool]:
         """
         Apply an action to multiple extensions and return a message with the results.
 
-        If only one extension is given, it is deferred to `manage()`.
+        The batch runs in a single worker thread so import I/O stays off
+        the event loop; disnake's load/unload path is not reentrant, so
+        the extensions themselves are managed sequentially. If only one
+        extension is given, it is deferred to `manage()`.
         """
-        if len(extensions) == 1:
-            msg, error_msg = self.manage(action, extensions[0])
-            return (msg, bool(error_msg))
+        # Drop duplicates while preserving order, so no extension is
+        # loaded or unloaded twice in one batch.
+        extensions = tuple(dict.fromkeys(extensions))
+
+        async with self._manage_lock:
+            if len(extensions) == 1:
+                msg, error_msg = self.manage(verb, extensions[0])
+                return (msg, bool(error_msg))
+
+            def run_batch() -> list[tuple[str, t.Optional[str]]]:
+                return [self.manage(verb, ext) for ext in extensions]
+
+            results = await asyncio.to_thread(run_batch)
 
-        verb = action.name.lower()
-        failures = {}
+        # The worker thread can't schedule disnake's delayed command sync
+        # (loop.create_task is loop-thread only), so re-trigger it here.
+        self.bot._schedule_delayed_command_sync()
 
-        for extension in extensions:
-            _, error = self.manage(action, extension)
-            if error:
-                failures[extension] = error
+        failures = {ext: error for ext, (_, error) in zip(extensions, results) if error}
 
         msg = f"{len(extensions) - len(failures)} / {len(extensions)} extensions {verb}ed."
         status = bool(failures)
@@ -184,17 +207,16 @@ class Extensions(commands.Cog):
         logger.debug(f"Batch {verb}ed extensions.")
         return msg, status
 
-    def manage(self, action: Action, ext: str) -> t.Tuple[str, t.Optional[str]]:
+    def manage(self, verb: str, ext: str) -> t.Tuple[str, t.Optional[str]]:
         """Apply an action to an extension and return the status message and any error message."""
-        verb = action.name.lower()
         error_msg = None
 
         try:
-            action.value(self.bot, ext)
+            getattr(self.bot, _ACTION_METHODS[verb])(ext)
         except (commands.ExtensionAlreadyLoaded, commands.ExtensionNotLoaded):
-            if action is Action.RELOAD:
+            if verb == "reload":
                 # When reloading, just load the extension if it was not loaded.
-                return self.manage(Action.LOAD, ext)
+                return self.manage("load", ext)
 
             msg = f"Extension `{ext}` is already {verb}ed."
             logger.debug(msg[4:])
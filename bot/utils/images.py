@@ -1,5 +1,7 @@
+import asyncio
 import io
 import os
+from collections import OrderedDict
 from urllib.parse import urlparse
 from xml.etree.ElementTree import ParseError
 
@@ -11,23 +13,95 @@ from disnake.ext import commands
 from PIL import Image, UnidentifiedImageError
 
 
+_session: aiohttp.ClientSession | None = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Returns the shared client session, creating it on first use.
+
+    Reusing a single session keeps connections alive between downloads,
+    avoiding a new TCP+TLS handshake on every call.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+            )
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Closes the shared client session, if one was created."""
+    if _session is not None and not _session.closed:
+        await _session.close()
+
+
+# Downloaded bodies keyed by URL, so repeated requests for unchanged
+# assets can be answered with a conditional request and no body transfer.
+_etag_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+_ETAG_CACHE_SIZE = 256
+
+
+async def _read_body(resp: aiohttp.ClientResponse) -> bytes:
+    """Reads the response body, preallocating the buffer when the size is known."""
+    size = int(resp.headers.get("Content-Length", 0))
+    if not size or resp.headers.get("Content-Encoding", "identity") != "identity":
+        # For encoded responses, Content-Length is the compressed wire
+        # size while aiohttp yields decompressed chunks, so the
+        # preallocated buffer would overflow.
+        return await resp.read()
+
+    # Preallocate the full buffer and stream chunks into it, avoiding
+    # the amortized doubling of resp.read().
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    offset = 0
+    async for chunk in resp.content.iter_chunked(65536):
+        view[offset : offset + len(chunk)] = chunk
+        offset += len(chunk)
+    return bytes(buffer)
+
+
 async def download_bytes(url: str) -> io.BytesIO:
     """Downloads bytes from a given `url` and return it."""
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(url) as resp:
-                if resp.status == 200:
-                    return io.BytesIO(await resp.read())
+    session = await get_session()
+
+    headers = {}
+    if cached := _etag_cache.get(url):
+        headers["If-None-Match"] = cached[0]
 
-                raise commands.BadArgument(f"The given [URL]({url}) can't be accessed.")
-        except (aiohttp.InvalidURL, aiohttp.ClientConnectionError):
-            raise commands.BadArgument("The given URL is invalid.")
+    try:
+        async with session.get(url, headers=headers) as resp:
+            if resp.status == 304 and cached:
+                # The entry may have been evicted while the request was
+                # in flight; `cached` is only a local snapshot.
+                if url in _etag_cache:
+                    _etag_cache.move_to_end(url)
+                return io.BytesIO(cached[1])
+
+            if resp.status == 200:
+                body = await _read_body(resp)
+                if etag := resp.headers.get("ETag"):
+                    _etag_cache[url] = (etag, body)
+                    _etag_cache.move_to_end(url)
+                    if len(_etag_cache) > _ETAG_CACHE_SIZE:
+                        _etag_cache.popitem(last=False)
+                return io.BytesIO(body)
+
+            raise commands.BadArgument(f"The given [URL]({url}) can't be accessed.")
+    except (aiohttp.InvalidURL, aiohttp.ClientConnectionError):
+        raise commands.BadArgument("The given URL is invalid.")
 
 
 async def download_image(url: str) -> Image.Image:
     """Downloads image from a url and returns a it."""
     try:
-        return Image.open(await download_bytes(url))
+        return await asyncio.to_thread(Image.open, await download_bytes(url))
     except UnidentifiedImageError:
         raise commands.BadArgument(f"The given [URL]({url}) leads to an invalid image.")
 
@@ -47,8 +121,20 @@ def image_to_file(
         raise ValueError(
             f"'{format}' is not one of the supported formats ({', '.join(OUTPUT_IMAGE_FORMATS)})."
         )
-    if format in ["JPEG", "PDF"]:
-        image = image.convert("RGB")  # Removes transparancy
+    if format in ("JPEG", "PDF"):
+        if image.mode in ("RGBA", "LA", "P"):
+            # Flatten onto white rather than convert()'s black, and only
+            # allocate the extra copy when there is transparency to drop.
+            if image.mode == "P":
+                image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(
+                image, mask=image.getchannel("A") if "A" in image.getbands() else None
+            )
+            image = background
+        elif image.mode not in ("L", "RGB", "CMYK"):
+            # Modes like "I" and "F" can't be encoded as JPEG/PDF.
+            image = image.convert("RGB")
 
     with io.BytesIO() as image_binary:
         image.save(image_binary, format)
@@ -59,12 +145,22 @@ def image_to_file(
         )
 
 
-def bytes_to_file(byte_stream: bytes, filename: str = None) -> disnake.File:
-    """Converts a bytes-like object to a Disnake File object."""
+def bytes_to_file(
+    byte_stream: bytes, filename: str = None, format: str = None
+) -> disnake.File:
+    """
+    Converts a bytes-like object to a Disnake File object.
+
+    If no `format` is given, the bytes are passed through as-is, without
+    being decoded and re-encoded, and `filename` should include the
+    extension. When `format` is given, the image is converted to it and
+    the extension is appended automatically.
+    """
+    if format is None:
+        return disnake.File(fp=io.BytesIO(byte_stream), filename=filename or "image")
+
     image = Image.open(io.BytesIO(byte_stream))
-    if filename:
-        return image_to_file(image, filename)
-    return image_to_file(image)
+    return image_to_file(image, filename or "image", format)
 
 
 def filename_from_url(url: str) -> str:
@@ -79,27 +175,25 @@ def filename_from_url(url: str) -> str:
     return filename.split(".")[0]
 
 
-def image_to_mask(image: Image.Image) -> Image.Image:
-    data: list[int] = []
-    for item in image.convert("RGBA").getdata():
-        data.append(0 if item[3] == 0 else 256)
-
-    mask = Image.new("L", image.size)
-    mask.putdata(data)
-    return mask
-
-
 def add_background(image: Image.Image, color: str | int):
     canvas = Image.new("RGBA", image.size, color=color)
-    return Image.composite(image, canvas, image_to_mask(image))
+    canvas.alpha_composite(image if image.mode == "RGBA" else image.convert("RGBA"))
+    return canvas
 
 
-def rasterize_svg(bytestream: bytes, scale: int = 1) -> Image.Image:
+def _rasterize_svg(bytestream: bytes, scale: int = 1) -> Image.Image:
+    buffer = io.BytesIO()
     try:
-        output = cairosvg.svg2png(bytestring=bytestream, scale=scale)
+        cairosvg.svg2png(bytestring=bytestream, scale=scale, write_to=buffer)
     except ParseError:
         raise commands.BadArgument("The provided URL returns to an invalid SVG.")
-    if not output:
+    if not buffer.getbuffer().nbytes:
         raise commands.BadArgument("No image was found.")
 
-    return Image.open(io.BytesIO(output))
+    buffer.seek(0)
+    return Image.open(buffer)
+
+
+async def rasterize_svg(bytestream: bytes, scale: int = 1) -> Image.Image:
+    """Rasterizes an SVG in a worker thread, keeping the event loop responsive."""
+    return await asyncio.to_thread(_rasterize_svg, bytestream, scale)